@@ -0,0 +1,67 @@
+"""
+Constants and scalar step functions shared by every ChronoHash backend.
+
+chronohash.py builds its class attributes from the constants here, and the
+Numba and CUDA modules compile the step functions below with their own
+decorators (njit(inline='always') and cuda.jit(device=True, inline=True)),
+so the block function is written down once for all backends.
+
+The step functions are plain Python on 32-bit values held in wider ints.
+They call no other function, since a compiled caller can only call
+compiled code.
+"""
+
+# Carefully selected large primes for mixing, one per state word
+PRIMES = (
+    0x9E3779B9,           # Golden ratio * 2^32 (optimized for 32-bit)
+    0x85EBCA6B,           # Large prime 1
+    0xC2B2AE35,           # Large prime 2
+    0x92D68CA2,           # Large prime 3
+    0xA5CB9243,           # Large prime 4
+    0xDF442D22,           # Large prime 5
+    0x8B2B8C1F,           # Large prime 6
+    0xCC9E2D51,           # Large prime 7
+)
+
+# Initial state vector (derived from first 8 digits of e, pi, phi), also
+# added back into the state after every block
+INITIAL_STATE = (
+    0x2B7E1516, 0x28AED2A6, 0xABF71588, 0x09CF4F3C,
+    0x762E7160, 0xF38B4DA5, 0x6A09E667, 0xBB67AE85,
+)
+
+# Rotation amounts for each round, repeating every 16 rounds
+ROTATIONS = (7, 12, 17, 22, 5, 9, 14, 20, 4, 11, 16, 23, 6, 10, 15, 21)
+
+
+def rotl32(x, shift):
+    """Rotate a 32-bit value left by shift bits."""
+    x &= 0xFFFFFFFF
+    return ((x << shift) | (x >> (32 - shift))) & 0xFFFFFFFF
+
+
+def mix(a, b, c, prime):
+    """Mixing function used by temporal diffusion."""
+    temp = ((a ^ b) + c) & 0xFFFFFFFF
+    temp = ((temp << 13) | (temp >> 19)) & 0xFFFFFFFF
+    temp = (temp * prime) & 0xFFFFFFFF
+    temp ^= temp >> 16
+    temp = ((temp << 5) | (temp >> 27)) & 0xFFFFFFFF
+    return (temp + prime) & 0xFFFFFFFF
+
+
+def step(a, b, c, d, prime, rotation):
+    """One rotation-XOR cascade step of a compression round."""
+    b &= 0xFFFFFFFF
+    temp = (a ^ ((b << rotation) | (b >> (32 - rotation)))) & 0xFFFFFFFF
+    temp = (temp + c) & 0xFFFFFFFF
+    temp ^= d
+    temp = (temp * prime) & 0xFFFFFFFF
+    return (a + ((temp << 11) | (temp >> 21))) & 0xFFFFFFFF
+
+
+def fast_step(a, b, c, d, prime, rotation):
+    """One step of a fast-mode round (no output rotation)."""
+    b &= 0xFFFFFFFF
+    temp = (((a ^ ((b << rotation) | (b >> (32 - rotation)))) + c) ^ d) & 0xFFFFFFFF
+    return (a + temp * prime) & 0xFFFFFFFF
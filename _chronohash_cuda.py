@@ -0,0 +1,199 @@
+"""
+CUDA kernel for batch ChronoHash.
+
+One GPU thread hashes one message, keeping its 8-word chaining state in
+registers, so thousands of independent messages are processed at once. The
+block function is the same as _chronohash_numba._nb_hash_words and
+_nb_hash_words_fast; padding and the dynamic round count are computed on
+the device too, so the host only uploads the concatenated message bytes.
+
+This module is optional: importing it raises ImportError when NumPy or
+Numba is not installed, and _cuda_hash_batch is None when no CUDA device
+(or the Numba CUDA simulator) is available.
+"""
+
+import numpy as np
+from numba import cuda
+
+# ChronoHash constants as global tuples, which Numba freezes into the kernel
+# as immediates (no constant-memory loads, no per-launch uploads)
+from _chronohash_common import INITIAL_STATE as _INIT
+from _chronohash_common import PRIMES as _PRIMES
+from _chronohash_common import ROTATIONS as _ROT
+from _chronohash_common import fast_step, mix, rotl32, step
+
+# Threads per block; hashing is register-bound, so a modest block size
+# keeps occupancy up without spilling the per-thread state
+_THREADS_PER_BLOCK = 128
+
+# The shared step functions as inlined device functions
+_rotl32 = cuda.jit(device=True, inline=True)(rotl32)
+_mix = cuda.jit(device=True, inline=True)(mix)
+_step = cuda.jit(device=True, inline=True)(step)
+_fast_step = cuda.jit(device=True, inline=True)(fast_step)
+
+
+@cuda.jit(device=True, inline=True)
+def _padded_byte(data, start, length, padded_len, pos):
+    """Byte pos of a message after Merkle-Damgard padding."""
+    if pos < length:
+        return np.int64(data[start + pos])
+    if pos == length:
+        return np.int64(0x80)
+    if pos >= padded_len - 8:
+        # 64-bit big-endian bit length in the last 8 bytes
+        return ((np.int64(length) * 8) >> (8 * (padded_len - 1 - pos))) & 0xFF
+    return np.int64(0)
+
+
+@cuda.jit(device=True, inline=True)
+def _load_word(data, start, length, padded_len, pos, in_tail):
+    """Little-endian message word at padded byte offset pos."""
+    if in_tail:
+        return (_padded_byte(data, start, length, padded_len, pos)
+                | (_padded_byte(data, start, length, padded_len, pos + 1) << 8)
+                | (_padded_byte(data, start, length, padded_len, pos + 2) << 16)
+                | (_padded_byte(data, start, length, padded_len, pos + 3) << 24))
+    i = start + pos
+    return (np.int64(data[i]) | (np.int64(data[i + 1]) << 8)
+            | (np.int64(data[i + 2]) << 16) | (np.int64(data[i + 3]) << 24))
+
+
+@cuda.jit(device=True, inline=True)
+def _count_unique(data, start, length):
+    """Count distinct byte values with a 256-bit presence mask."""
+    mask = cuda.local.array(4, dtype=np.uint64)
+    for k in range(4):
+        mask[k] = 0
+    for i in range(start, start + length):
+        b = data[i]
+        mask[b >> 6] |= np.uint64(1) << np.uint64(b & 63)
+    return cuda.popc(mask[0]) + cuda.popc(mask[1]) + cuda.popc(mask[2]) + cuda.popc(mask[3])
+
+
+@cuda.jit
+def _cuda_hash(out, data, offsets, fast_mode):
+    """
+    Hash one message per thread.
+
+    Args:
+        out: (N, 8) uint32 output states
+        data: All messages concatenated, as uint8
+        offsets: N + 1 offsets; message m is data[offsets[m]:offsets[m + 1]]
+        fast_mode: Nonzero to run the fast-mode block function
+    """
+    lane = cuda.grid(1)
+    if lane >= out.shape[0]:
+        return
+
+    start = offsets[lane]
+    length = offsets[lane + 1] - start
+    padded_len = (length + 9 + 63) // 64 * 64
+    full_len = length // 64 * 64
+
+    total_rounds = 8
+    if not fast_mode:
+        # Same as _calculate_dynamic_rounds: 20 + int(unique / 256 * 12)
+        total_rounds = 20
+        if length > 0:
+            total_rounds += (_count_unique(data, start, length) * 12) >> 8
+
+    d = cuda.local.array(16, dtype=np.int64)
+    s0 = np.int64(_INIT[0])
+    s1 = np.int64(_INIT[1])
+    s2 = np.int64(_INIT[2])
+    s3 = np.int64(_INIT[3])
+    s4 = np.int64(_INIT[4])
+    s5 = np.int64(_INIT[5])
+    s6 = np.int64(_INIT[6])
+    s7 = np.int64(_INIT[7])
+
+    for block in range(0, padded_len, 64):
+        # Full blocks read message bytes directly; only the tail pads
+        in_tail = block >= full_len
+        for k in range(16):
+            d[k] = _load_word(data, start, length, padded_len, block + 4 * k, in_tail)
+
+        if fast_mode:
+            for r in range(8):
+                rot = _ROT[r]
+                s0 = _fast_step(s0, s1, s5, d[r], _PRIMES[0], rot)
+                s1 = _fast_step(s1, s2, s6, d[r + 1], _PRIMES[1], rot)
+                s2 = _fast_step(s2, s3, s7, d[r + 2], _PRIMES[2], rot)
+                s3 = _fast_step(s3, s4, s0, d[r + 3], _PRIMES[3], rot)
+                s4 = _fast_step(s4, s5, s1, d[r + 4], _PRIMES[4], rot)
+                s5 = _fast_step(s5, s6, s2, d[r + 5], _PRIMES[5], rot)
+                s6 = _fast_step(s6, s7, s3, d[r + 6], _PRIMES[6], rot)
+                s7 = _fast_step(s7, s0, s4, d[r + 7], _PRIMES[7], rot)
+        else:
+            # Temporal diffusion: positions 5, 6, 7 cascade into 0, 1, 2
+            # after those have been re-mixed
+            c5 = (s5 + d[5]) & 0xFFFFFFFF
+            c6 = (s6 + d[6]) & 0xFFFFFFFF
+            c7 = (s7 + d[7]) & 0xFFFFFFFF
+            n0 = (_mix(s0, s1, d[0], _PRIMES[0]) ^ _rotl32(c7, 4)
+                  ^ _rotl32(c6, 8) ^ _rotl32(c5, 12))
+            n1 = _mix(s1, s2, d[1], _PRIMES[1]) ^ _rotl32(c7, 8) ^ _rotl32(c6, 12)
+            n2 = _mix(s2, s3, d[2], _PRIMES[2]) ^ _rotl32(c7, 12)
+            n3 = _mix(s3, s4, d[3], _PRIMES[3])
+            n4 = _mix(s4, s5, d[4], _PRIMES[4])
+            n5 = _mix(s5, s6, d[5], _PRIMES[5])
+            n6 = _mix(s6, s7, d[6], _PRIMES[6])
+            n7 = _mix(s7, s0, d[7], _PRIMES[7])
+            s0, s1, s2, s3, s4, s5, s6, s7 = n0, n1, n2, n3, n4, n5, n6, n7
+
+            for r in range(total_rounds):
+                rot = _ROT[r & 15]
+                s0 = _step(s0, s1, s5, d[r & 15], _PRIMES[0], rot)
+                s1 = _step(s1, s2, s6, d[(r + 1) & 15], _PRIMES[1], rot)
+                s2 = _step(s2, s3, s7, d[(r + 2) & 15], _PRIMES[2], rot)
+                s3 = _step(s3, s4, s0, d[(r + 3) & 15], _PRIMES[3], rot)
+                s4 = _step(s4, s5, s1, d[(r + 4) & 15], _PRIMES[4], rot)
+                s5 = _step(s5, s6, s2, d[(r + 5) & 15], _PRIMES[5], rot)
+                s6 = _step(s6, s7, s3, d[(r + 6) & 15], _PRIMES[6], rot)
+                s7 = _step(s7, s0, s4, d[(r + 7) & 15], _PRIMES[7], rot)
+
+        s0 = (s0 + _INIT[0]) & 0xFFFFFFFF
+        s1 = (s1 + _INIT[1]) & 0xFFFFFFFF
+        s2 = (s2 + _INIT[2]) & 0xFFFFFFFF
+        s3 = (s3 + _INIT[3]) & 0xFFFFFFFF
+        s4 = (s4 + _INIT[4]) & 0xFFFFFFFF
+        s5 = (s5 + _INIT[5]) & 0xFFFFFFFF
+        s6 = (s6 + _INIT[6]) & 0xFFFFFFFF
+        s7 = (s7 + _INIT[7]) & 0xFFFFFFFF
+
+    out[lane, 0] = s0
+    out[lane, 1] = s1
+    out[lane, 2] = s2
+    out[lane, 3] = s3
+    out[lane, 4] = s4
+    out[lane, 5] = s5
+    out[lane, 6] = s6
+    out[lane, 7] = s7
+
+
+def _cuda_launch(data, offsets, fast_mode):
+    """
+    Upload a batch, run _cuda_hash with one thread per message and copy the
+    final states back.
+
+    Args:
+        data: All messages concatenated, as a uint8 array
+        offsets: N + 1 int64 offsets into data
+        fast_mode: Whether to run the fast-mode block function
+
+    Returns:
+        (N, 8) uint32 array of final states
+    """
+    lanes = offsets.shape[0] - 1
+    d_out = cuda.device_array((lanes, 8), dtype=np.uint32)
+    grid = (lanes + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+    # Keep at least one byte so an all-empty batch still has a device buffer
+    payload = data if data.shape[0] else np.zeros(1, dtype=np.uint8)
+    _cuda_hash[grid, _THREADS_PER_BLOCK](
+        d_out, cuda.to_device(payload), cuda.to_device(offsets), int(fast_mode))
+    return d_out.copy_to_host()
+
+
+# None when there is no device to launch on, mirroring the optional imports
+_cuda_hash_batch = _cuda_launch if cuda.is_available() else None
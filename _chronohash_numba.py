@@ -0,0 +1,443 @@
+"""
+Numba-compiled kernels for ChronoHash.
+
+These kernels implement exactly the same block function as the pure-Python
+code in chronohash.py, but operate on numpy.uint32 arrays so LLVM can emit
+native rotate/multiply/xor instructions instead of interpreting boxed ints.
+Each kernel hashes a whole padded message, so there is one call per message
+rather than one per block.
+
+This module is optional: importing it raises ImportError when NumPy or Numba
+is not installed, and chronohash.py falls back to the pure-Python path.
+"""
+
+import threading
+
+import numpy as np
+from numba import get_num_threads, njit, prange, threading_layer, types
+
+# ChronoHash.ROTATIONS as a global tuple, which Numba freezes into the
+# compiled code: indexed by a literal, each rotation is a constant shift
+from _chronohash_common import ROTATIONS as _ROT
+from _chronohash_common import fast_step, mix, rotl32, step
+
+_U32 = types.uint32[::1]
+_U32_RO = types.Array(types.uint32, 1, 'C', readonly=True)  # np.frombuffer views
+_U8_RO = types.Array(types.uint8, 1, 'C', readonly=True)
+_I64_RO = types.Array(types.int64, 1, 'C', readonly=True)
+_U32_2D = types.uint32[:, ::1]
+
+# The shared step functions, inlined into every kernel that calls them
+_rotl32 = njit(inline='always')(rotl32)
+_mix = njit(inline='always')(mix)
+_step = njit(inline='always')(step)
+_fast_step = njit(inline='always')(fast_step)
+
+
+@njit
+def _round(s, data, k, P, rotation):
+    """
+    One compression round; k is the round number mod 16, so the data
+    indices and the rotation are compile-time constants at each call site.
+    """
+    s0, s1, s2, s3, s4, s5, s6, s7 = s
+    s0 = _step(s0, s1, s5, data[k & 15], P[0], rotation)
+    s1 = _step(s1, s2, s6, data[(k + 1) & 15], P[1], rotation)
+    s2 = _step(s2, s3, s7, data[(k + 2) & 15], P[2], rotation)
+    s3 = _step(s3, s4, s0, data[(k + 3) & 15], P[3], rotation)
+    s4 = _step(s4, s5, s1, data[(k + 4) & 15], P[4], rotation)
+    s5 = _step(s5, s6, s2, data[(k + 5) & 15], P[5], rotation)
+    s6 = _step(s6, s7, s3, data[(k + 6) & 15], P[6], rotation)
+    s7 = _step(s7, s0, s4, data[(k + 7) & 15], P[7], rotation)
+    return s0, s1, s2, s3, s4, s5, s6, s7
+
+
+@njit
+def _fast_round(s, data, r, P, rotation):
+    """One fast-mode round r (0-7) with constant data indices and rotation."""
+    s0, s1, s2, s3, s4, s5, s6, s7 = s
+    s0 = _fast_step(s0, s1, s5, data[r], P[0], rotation)
+    s1 = _fast_step(s1, s2, s6, data[r + 1], P[1], rotation)
+    s2 = _fast_step(s2, s3, s7, data[r + 2], P[2], rotation)
+    s3 = _fast_step(s3, s4, s0, data[r + 3], P[3], rotation)
+    s4 = _fast_step(s4, s5, s1, data[r + 4], P[4], rotation)
+    s5 = _fast_step(s5, s6, s2, data[r + 5], P[5], rotation)
+    s6 = _fast_step(s6, s7, s3, data[r + 6], P[6], rotation)
+    s7 = _fast_step(s7, s0, s4, data[r + 7], P[7], rotation)
+    return s0, s1, s2, s3, s4, s5, s6, s7
+
+
+@njit(inline='always')
+def _count_unique(data):
+    """
+    Count distinct byte values with a 256-entry presence table.
+
+    Marking the table is a plain store per byte, with no read-modify-write
+    dependency between bytes. The table is tallied every 1024 bytes so that
+    inputs containing all 256 values stop early.
+    """
+    seen = np.zeros(256, dtype=np.uint8)
+    n = data.shape[0]
+    count = np.int64(0)
+    for start in range(0, n, 1024):
+        for i in range(start, min(start + 1024, n)):
+            seen[data[i]] = 1
+        count = np.int64(0)
+        for k in range(256):
+            count += seen[k]
+        if count == 256:
+            break
+    return count
+
+
+@njit(types.int64(_U8_RO), cache=True, nogil=True)
+def _nb_unique_bytes(data):
+    """
+    Count distinct byte values.
+
+    Args:
+        data: Message bytes as a uint8 array
+
+    Returns:
+        Number of distinct byte values (0-256)
+    """
+    return _count_unique(data)
+
+
+@njit(inline='always')
+def _load_block(words, offset):
+    """Load the 16 message words of the block starting at offset."""
+    return (np.int64(words[offset]), np.int64(words[offset + 1]),
+            np.int64(words[offset + 2]), np.int64(words[offset + 3]),
+            np.int64(words[offset + 4]), np.int64(words[offset + 5]),
+            np.int64(words[offset + 6]), np.int64(words[offset + 7]),
+            np.int64(words[offset + 8]), np.int64(words[offset + 9]),
+            np.int64(words[offset + 10]), np.int64(words[offset + 11]),
+            np.int64(words[offset + 12]), np.int64(words[offset + 13]),
+            np.int64(words[offset + 14]), np.int64(words[offset + 15]))
+
+
+@njit(inline='always')
+def _load_block_bytes(buf, pos):
+    """Load 16 little-endian message words from 64 bytes starting at pos."""
+    return (_le32(buf, pos), _le32(buf, pos + 4), _le32(buf, pos + 8), _le32(buf, pos + 12),
+            _le32(buf, pos + 16), _le32(buf, pos + 20), _le32(buf, pos + 24), _le32(buf, pos + 28),
+            _le32(buf, pos + 32), _le32(buf, pos + 36), _le32(buf, pos + 40), _le32(buf, pos + 44),
+            _le32(buf, pos + 48), _le32(buf, pos + 52), _le32(buf, pos + 56), _le32(buf, pos + 60))
+
+
+@njit(inline='always')
+def _le32(buf, pos):
+    """Read one little-endian 32-bit word from a byte array."""
+    return (np.int64(buf[pos]) | (np.int64(buf[pos + 1]) << 8)
+            | (np.int64(buf[pos + 2]) << 16) | (np.int64(buf[pos + 3]) << 24))
+
+
+@njit(inline='always')
+def _as_words(arr):
+    """Load an 8-element constant array as a tuple of int64 words."""
+    return (np.int64(arr[0]), np.int64(arr[1]), np.int64(arr[2]), np.int64(arr[3]),
+            np.int64(arr[4]), np.int64(arr[5]), np.int64(arr[6]), np.int64(arr[7]))
+
+
+@njit(inline='always')
+def _add_words(s, I):
+    """Add the IV to the state word by word (final mixing of each block)."""
+    return ((s[0] + I[0]) & 0xFFFFFFFF, (s[1] + I[1]) & 0xFFFFFFFF,
+            (s[2] + I[2]) & 0xFFFFFFFF, (s[3] + I[3]) & 0xFFFFFFFF,
+            (s[4] + I[4]) & 0xFFFFFFFF, (s[5] + I[5]) & 0xFFFFFFFF,
+            (s[6] + I[6]) & 0xFFFFFFFF, (s[7] + I[7]) & 0xFFFFFFFF)
+
+
+@njit(inline='always')
+def _store_words(s):
+    """Store a state tuple into a new uint32[8] array."""
+    out = np.empty(8, dtype=np.uint32)
+    for i in range(8):
+        out[i] = s[i]
+    return out
+
+
+@njit
+def _block(s, d, total_rounds, P, I):
+    """
+    Process a single 512-bit block in normal mode.
+
+    Args:
+        s: Current 8-word chaining state
+        d: 16 message words of the block
+        total_rounds: Number of compression rounds
+        P, I: Primes and IV as word tuples
+
+    Returns:
+        New 8-word chaining state
+    """
+    s0, s1, s2, s3, s4, s5, s6, s7 = s
+
+    # Temporal diffusion: positions 5, 6, 7 cascade into 0, 1, 2 after
+    # those have been re-mixed; earlier cascades are overwritten.
+    c5 = (s5 + d[5]) & 0xFFFFFFFF
+    c6 = (s6 + d[6]) & 0xFFFFFFFF
+    c7 = (s7 + d[7]) & 0xFFFFFFFF
+    s = (_mix(s0, s1, d[0], P[0]) ^ _rotl32(c7, 4) ^ _rotl32(c6, 8) ^ _rotl32(c5, 12),
+         _mix(s1, s2, d[1], P[1]) ^ _rotl32(c7, 8) ^ _rotl32(c6, 12),
+         _mix(s2, s3, d[2], P[2]) ^ _rotl32(c7, 12),
+         _mix(s3, s4, d[3], P[3]),
+         _mix(s4, s5, d[4], P[4]),
+         _mix(s5, s6, d[5], P[5]),
+         _mix(s6, s7, d[6], P[6]),
+         _mix(s7, s0, d[7], P[7]))
+
+    # Compression rounds, unrolled over the 16-round rotation cycle so each
+    # round's rotation and data indices are constants (each step sees the
+    # already-updated words)
+    for base in range(0, total_rounds, 16):
+        n = total_rounds - base
+        s = _round(s, d, 0, P, _ROT[0])
+        if n > 1:
+            s = _round(s, d, 1, P, _ROT[1])
+        if n > 2:
+            s = _round(s, d, 2, P, _ROT[2])
+        if n > 3:
+            s = _round(s, d, 3, P, _ROT[3])
+        if n > 4:
+            s = _round(s, d, 4, P, _ROT[4])
+        if n > 5:
+            s = _round(s, d, 5, P, _ROT[5])
+        if n > 6:
+            s = _round(s, d, 6, P, _ROT[6])
+        if n > 7:
+            s = _round(s, d, 7, P, _ROT[7])
+        if n > 8:
+            s = _round(s, d, 8, P, _ROT[8])
+        if n > 9:
+            s = _round(s, d, 9, P, _ROT[9])
+        if n > 10:
+            s = _round(s, d, 10, P, _ROT[10])
+        if n > 11:
+            s = _round(s, d, 11, P, _ROT[11])
+        if n > 12:
+            s = _round(s, d, 12, P, _ROT[12])
+        if n > 13:
+            s = _round(s, d, 13, P, _ROT[13])
+        if n > 14:
+            s = _round(s, d, 14, P, _ROT[14])
+        if n > 15:
+            s = _round(s, d, 15, P, _ROT[15])
+
+    return _add_words(s, I)
+
+
+@njit
+def _block_fast(s, d, P, I):
+    """
+    Process a single 512-bit block in fast mode (8 fixed rounds).
+
+    Args:
+        s: Current 8-word chaining state
+        d: 16 message words of the block
+        P, I: Primes and IV as word tuples
+
+    Returns:
+        New 8-word chaining state
+    """
+    s = _fast_round(s, d, 0, P, _ROT[0])
+    s = _fast_round(s, d, 1, P, _ROT[1])
+    s = _fast_round(s, d, 2, P, _ROT[2])
+    s = _fast_round(s, d, 3, P, _ROT[3])
+    s = _fast_round(s, d, 4, P, _ROT[4])
+    s = _fast_round(s, d, 5, P, _ROT[5])
+    s = _fast_round(s, d, 6, P, _ROT[6])
+    s = _fast_round(s, d, 7, P, _ROT[7])
+    return _add_words(s, I)
+
+
+# Explicit signatures compile (or load from the on-disk cache) at import,
+# so the first hash() call does not pay JIT latency. The entry points are
+# nogil: they only touch NumPy buffers, so threads can hash concurrently
+# (large batches are the exception, see _nb_hash_many_parallel)
+@njit(_U32(_U32_RO, types.int64, _U32, _U32), cache=True, nogil=True)
+def _nb_hash_words(words, total_rounds, PRIMES, INIT):
+    """
+    Hash a padded message in normal mode, all blocks in one native call.
+
+    Args:
+        words: Padded message as little-endian uint32 words (multiple of 16)
+        total_rounds: Number of compression rounds per block
+        PRIMES, INIT: ChronoHash constants as arrays
+
+    Returns:
+        Final 8-word state
+    """
+    P = _as_words(PRIMES)
+    I = _as_words(INIT)
+    s = I
+    for offset in range(0, words.shape[0], 16):
+        s = _block(s, _load_block(words, offset), total_rounds, P, I)
+    return _store_words(s)
+
+
+@njit(_U32(_U32_RO, _U32, _U32), cache=True, nogil=True)
+def _nb_hash_words_fast(words, PRIMES, INIT):
+    """
+    Hash a padded message in fast mode, all blocks in one native call.
+
+    Args:
+        words: Padded message as little-endian uint32 words (multiple of 16)
+        PRIMES, INIT: ChronoHash constants as arrays
+
+    Returns:
+        Final 8-word state
+    """
+    P = _as_words(PRIMES)
+    I = _as_words(INIT)
+    s = I
+    for offset in range(0, words.shape[0], 16):
+        s = _block_fast(s, _load_block(words, offset), P, I)
+    return _store_words(s)
+
+
+@njit
+def _hash_message(msg, fast_mode, P, I, tail):
+    """
+    Hash one raw message, padding it and choosing its round count here.
+
+    Args:
+        msg: Message bytes as a uint8 array
+        fast_mode: Whether to run the fast-mode block function
+        P, I: Primes and IV as word tuples
+        tail: 128-byte scratch buffer for the padded final block(s)
+
+    Returns:
+        Final 8-word state
+    """
+    length = msg.shape[0]
+    total_rounds = 8
+    if not fast_mode:
+        # Same as _calculate_dynamic_rounds: 20 + int(unique / 256 * 12)
+        total_rounds = 20
+        if length > 0:
+            total_rounds += (_count_unique(msg) * 12) >> 8
+
+    # Merkle-Damgard tail: remaining bytes, 0x80, zeros and the 64-bit
+    # big-endian bit length, in one block or two
+    full = length // 64
+    rem = length - full * 64
+    tail_len = 64 if rem < 56 else 128
+    tail[:] = 0
+    tail[:rem] = msg[full * 64:]
+    tail[rem] = 0x80
+    bits = np.int64(length) * 8
+    for k in range(8):
+        tail[tail_len - 1 - k] = (bits >> (8 * k)) & 0xFF
+
+    # Full blocks straight from the message bytes, then the tail; one loop
+    # body, so each block function is inlined (and compiled) only once
+    s = I
+    for block in range(full + tail_len // 64):
+        if block < full:
+            d = _load_block_bytes(msg, block * 64)
+        else:
+            d = _load_block_bytes(tail, (block - full) * 64)
+        if fast_mode:
+            s = _block_fast(s, d, P, I)
+        else:
+            s = _block(s, d, total_rounds, P, I)
+    return s
+
+
+@njit(_U32_2D(_U8_RO, _I64_RO, types.boolean, _U32, _U32), cache=True, nogil=True)
+def _nb_hash_many(data, offsets, fast_mode, PRIMES, INIT):
+    """
+    Hash many messages in one native call, padding and choosing each
+    message's round count inside the kernel.
+
+    Args:
+        data: All messages concatenated, as a uint8 array
+        offsets: N + 1 offsets; message m is data[offsets[m]:offsets[m + 1]]
+        fast_mode: Whether to run the fast-mode block function
+        PRIMES, INIT: ChronoHash constants as arrays
+
+    Returns:
+        (N, 8) array of final states
+    """
+    n = offsets.shape[0] - 1
+    out = np.empty((n, 8), dtype=np.uint32)
+    P = _as_words(PRIMES)
+    I = _as_words(INIT)
+    tail = np.empty(128, dtype=np.uint8)
+    for m in range(n):
+        s = _hash_message(data[offsets[m]:offsets[m + 1]], fast_mode, P, I, tail)
+        for i in range(8):
+            out[m, i] = s[i]
+    return out
+
+
+# No signature: the parallel kernel is the slowest to compile, so it is
+# built (or loaded from the on-disk cache) on the first large batch rather
+# than on every import
+@njit(cache=True, nogil=True, parallel=True)
+def _nb_hash_many_prange(data, offsets, fast_mode, PRIMES, INIT):
+    """
+    Multithreaded _nb_hash_many: messages are spread over Numba's thread
+    pool with prange, each thread using its own tail buffer.
+
+    Args:
+        data: All messages concatenated, as a uint8 array
+        offsets: N + 1 offsets; message m is data[offsets[m]:offsets[m + 1]]
+        fast_mode: Whether to run the fast-mode block function
+        PRIMES, INIT: ChronoHash constants as arrays
+
+    Returns:
+        (N, 8) array of final states
+    """
+    n = offsets.shape[0] - 1
+    out = np.empty((n, 8), dtype=np.uint32)
+    P = _as_words(PRIMES)
+    I = _as_words(INIT)
+    for m in prange(n):
+        tail = np.empty(128, dtype=np.uint8)
+        s = _hash_message(data[offsets[m]:offsets[m + 1]], fast_mode, P, I, tail)
+        for i in range(8):
+            out[m, i] = s[i]
+    return out
+
+
+# Numba's workqueue threading layer aborts the process when two threads
+# launch parallel kernels at once; tbb and omp allow it
+_THREADSAFE_LAYERS = ('tbb', 'omp')
+_parallel_lock = threading.Lock()
+_parallel_threadsafe = False
+
+# Start Numba's thread pool here, from the importing (normally main)
+# thread: under TBB, a pool first started by a worker thread, such as a
+# parallel hash_batch() run from a ThreadPoolExecutor, hangs interpreter
+# exit. Starting it costs about 2.5 ms
+get_num_threads()
+
+
+def _nb_hash_many_parallel(data, offsets, fast_mode, PRIMES, INIT):
+    """
+    Run _nb_hash_many_prange, one call at a time unless the threading
+    layer is threadsafe.
+
+    The layer is only known once the first parallel kernel has run, so
+    calls are serialized until then; under workqueue they stay serialized,
+    and threads hashing large batches take turns on the thread pool.
+
+    Args:
+        data: All messages concatenated, as a uint8 array
+        offsets: N + 1 offsets; message m is data[offsets[m]:offsets[m + 1]]
+        fast_mode: Whether to run the fast-mode block function
+        PRIMES, INIT: ChronoHash constants as arrays
+
+    Returns:
+        (N, 8) array of final states
+    """
+    global _parallel_threadsafe
+    if _parallel_threadsafe:
+        return _nb_hash_many_prange(data, offsets, fast_mode, PRIMES, INIT)
+    with _parallel_lock:
+        states = _nb_hash_many_prange(data, offsets, fast_mode, PRIMES, INIT)
+        _parallel_threadsafe = threading_layer() in _THREADSAFE_LAYERS
+    return states
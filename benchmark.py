@@ -10,7 +10,10 @@ This script demonstrates:
 
 import hashlib
 import time
-from chronohash import ChronoHash
+from chronohash import ChronoHash, hamming_distance
+
+# Display strings for the mixing primes, formatted once at import
+_PRIMES_HEX = [f"0x{prime:016X}" for prime in ChronoHash.PRIMES]
 
 
 def compare_hashes():
@@ -43,6 +46,7 @@ def compare_avalanche():
     print("\nChanging single bit in input and measuring output bit changes...\n")
     
     chronohash = ChronoHash()
+    sha256 = hashlib.sha256  # bound once, as in the benchmark loop
     
     test_pairs = [
         (b"test message", b"test messagf"),  # Changed 'e' to 'f'
@@ -54,12 +58,12 @@ def compare_avalanche():
         # ChronoHash
         chrono1 = chronohash.hash(msg1)
         chrono2 = chronohash.hash(msg2)
-        chrono_diff = sum(bin(b1 ^ b2).count('1') for b1, b2 in zip(chrono1, chrono2))
+        chrono_diff = hamming_distance(chrono1, chrono2)
         
         # SHA-256
-        sha1 = hashlib.sha256(msg1).digest()
-        sha2 = hashlib.sha256(msg2).digest()
-        sha_diff = sum(bin(b1 ^ b2).count('1') for b1, b2 in zip(sha1, sha2))
+        sha1 = sha256(msg1).digest()
+        sha2 = sha256(msg2).digest()
+        sha_diff = hamming_distance(sha1, sha2)
         
         print(f"Input 1: {msg1[:30]}")
         print(f"Input 2: {msg2[:30]}")
@@ -69,12 +73,18 @@ def compare_avalanche():
 
 
 def benchmark_performance():
-    """Benchmark performance of ChronoHash vs SHA-256."""
+    """Benchmark performance of ChronoHash backends vs SHA-256."""
     print("=" * 80)
     print("Performance Benchmark")
     print("=" * 80)
     
-    chronohash = ChronoHash()
+    # Every backend that can run here; each produces identical digests
+    backends = []
+    for backend in ChronoHash.BACKENDS:
+        try:
+            backends.append((backend, ChronoHash(backend=backend)))
+        except RuntimeError:
+            continue
     
     test_sizes = [
         (10, "10 bytes", 1000),
@@ -83,29 +93,42 @@ def benchmark_performance():
         (10000, "10 KB", 10),
     ]
     
-    print(f"\nPerformance comparison (iterations vary by size)...\n")
-    print(f"{'Size':<15} {'ChronoHash':<20} {'SHA-256':<20} {'Note':<20}")
-    print("-" * 75)
+    print(f"\nPerformance comparison in hashes/second (iterations vary by size)...")
+    print("ChronoHash columns are batch throughput (one hash_batch() call over all")
+    print("iterations); SHA-256 is one hashlib call per message.\n")
+    header = f"{'Size':<15}" + "".join(f"{name + ' batch':>14}" for name, _ in backends)
+    print(f"{header}{'SHA-256':>14}   {'Note':<20}")
+    print("-" * (len(header) + 37))
+    
+    # One untimed run of the first row per backend, so its timing does not
+    # include the lazy CUDA kernel compile or _make_block_fn's code
+    # generation (a full-size batch also warms the NumPy lane variant)
+    size, _, iterations = test_sizes[0]
+    for _, chronohash in backends:
+        chronohash.hash_batch([b"x" * size] * iterations)
     
     for size, label, iterations in test_sizes:
         data = b"x" * size
         
-        # Benchmark ChronoHash
-        start = time.time()
-        for _ in range(iterations):
-            chronohash.hash(data)
-        chrono_time = time.time() - start
+        row = f"{label:<15}"
+        for _, chronohash in backends:
+            # Independent messages hashed as one batch
+            start = time.perf_counter()
+            chronohash.hash_batch([data] * iterations)
+            chrono_time = time.perf_counter() - start
+            chrono_rate = iterations / chrono_time if chrono_time > 0 else 0
+            row += f"{chrono_rate:>14.0f}"
         
-        # Benchmark SHA-256
-        start = time.time()
+        # Benchmark SHA-256 (constructor bound locally so the loop measures
+        # OpenSSL, not a global and attribute lookup per call)
+        sha256 = hashlib.sha256
+        start = time.perf_counter()
         for _ in range(iterations):
-            hashlib.sha256(data).digest()
-        sha_time = time.time() - start
-        
-        chrono_rate = iterations / chrono_time if chrono_time > 0 else 0
+            sha256(data).digest()
+        sha_time = time.perf_counter() - start
         sha_rate = iterations / sha_time if sha_time > 0 else 0
         
-        print(f"{label:<15} {chrono_rate:>8.0f} h/s        {sha_rate:>10.0f} h/s        {iterations} iterations")
+        print(f"{row}{sha_rate:>14.0f}   {iterations} iterations")
 
 
 def demonstrate_unique_features():
@@ -141,9 +164,9 @@ def demonstrate_unique_features():
     print("\n3. Multi-Prime Mixing")
     print("-" * 40)
     print("Uses 8 carefully selected prime numbers:")
-    for i, prime in enumerate(chronohash.PRIMES[:4]):  # Show first 4
-        print(f"  Prime {i+1}: 0x{prime:016X}")
-    print("  ... and 4 more primes")
+    for i in range(4):  # Show first 4
+        print(f"  Prime {i+1}: {_PRIMES_HEX[i]}")
+    print(f"  ... and {len(_PRIMES_HEX) - 4} more primes")
     
     # 4. Collision Demonstration
     print("\n4. Collision Resistance")
@@ -154,13 +177,13 @@ def demonstrate_unique_features():
     collisions = 0
     test_count = 1000
     
-    start = time.time()
+    start = time.perf_counter()
     for i in range(test_count):
         h = chronohash.hexdigest(f"test{i}".encode())
         if h in hashes:
             collisions += 1
         hashes.add(h)
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     
     print(f"Tested: {test_count} inputs")
     print(f"Unique hashes: {len(hashes)}")
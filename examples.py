@@ -84,9 +84,11 @@ def example_data_deduplication():
         (b"Unique document", "doc3.txt"),
     ]
     
-    for content, filename in documents:
-        hash_value = chronohash(content)
-        
+    # Hash every document in one batch call
+    hasher = ChronoHash()
+    hash_values = hasher.hexdigest_batch([content for content, _ in documents])
+    
+    for (content, filename), hash_value in zip(documents, hash_values):
         if hash_value in data_store:
             print(f"{filename}: Duplicate of {data_store[hash_value]}")
         else:
@@ -186,10 +188,8 @@ def example_batch_processing():
     items = [f"Item {i}" for i in range(10)]
     
     print("Hashing 10 items...")
-    hashes = []
-    for item in items:
-        h = hasher.hexdigest(item.encode())
-        hashes.append(h)
+    hashes = hasher.hexdigest_batch([item.encode() for item in items])
+    for item, h in zip(items, hashes):
         print(f"{item}: {h[:24]}...")
     
     print(f"\nAll hashes unique: {len(hashes) == len(set(hashes))}")
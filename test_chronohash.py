@@ -9,17 +9,35 @@ Tests cover:
 """
 
 import unittest
+import concurrent.futures
+from unittest import mock
 import hashlib
+import random
 import time
-from chronohash import ChronoHash, chronohash
+import chronohash as chronohash_module
+from chronohash import ChronoHash, chronohash, hamming_distance, _make_block_fn, _cuda_hash_batch
+
+
+def golden_messages():
+    """
+    The 52-message golden set: edge cases around the padding boundaries,
+    then 40 random messages of 0-699 bytes from a fixed seed.
+    """
+    messages = [b"", b"a", b"abc", b"message digest", bytes(range(256)), b"x" * 1000,
+                b"\x00" * 55, b"\x00" * 56, b"\xff" * 63, b"y" * 64, b"z" * 119, b"q" * 120]
+    rng = random.Random(1)
+    for _ in range(40):
+        messages.append(bytes(rng.randrange(256) for _ in range(rng.randrange(0, 700))))
+    return messages
 
 
 class TestChronoHashBasics(unittest.TestCase):
     """Test basic functionality of ChronoHash."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.hasher = ChronoHash()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one hasher shared by every test in the class."""
+        cls.hasher = ChronoHash()
     
     def test_empty_string(self):
         """Test hashing empty string."""
@@ -45,10 +63,11 @@ class TestChronoHashBasics(unittest.TestCase):
         ]
         
         for msg in test_cases:
-            digest = self.hasher.hexdigest(msg)
-            self.assertEqual(len(digest), 64, f"Failed for input length {len(msg)}")
-            # Verify it's valid hex
-            int(digest, 16)
+            with self.subTest(length=len(msg)):
+                digest = self.hasher.hexdigest(msg)
+                self.assertEqual(len(digest), 64)
+                # Verify it's valid hex
+                int(digest, 16)
     
     def test_convenience_function(self):
         """Test convenience function."""
@@ -61,9 +80,10 @@ class TestChronoHashBasics(unittest.TestCase):
 class TestHashProperties(unittest.TestCase):
     """Test cryptographic properties of ChronoHash."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.hasher = ChronoHash()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one hasher shared by every test in the class."""
+        cls.hasher = ChronoHash()
     
     def test_determinism(self):
         """Test that same input always produces same output."""
@@ -101,7 +121,7 @@ class TestHashProperties(unittest.TestCase):
         digest2 = self.hasher.hash(msg2)
         
         # Count differing bits
-        diff_bits = sum(bin(b1 ^ b2).count('1') for b1, b2 in zip(digest1, digest2))
+        diff_bits = hamming_distance(digest1, digest2)
         total_bits = len(digest1) * 8
         
         # Avalanche effect should cause ~50% bits to flip
@@ -122,8 +142,7 @@ class TestHashProperties(unittest.TestCase):
         
         self.assertNotEqual(digest1, digest2)
         # Should have significant difference
-        diff_bits = sum(bin(b1 ^ b2).count('1') 
-                       for b1, b2 in zip(bytes.fromhex(digest1), bytes.fromhex(digest2)))
+        diff_bits = (int(digest1, 16) ^ int(digest2, 16)).bit_count()
         self.assertGreater(diff_bits, 50)  # At least 50 bits different
     
     def test_order_sensitivity(self):
@@ -145,23 +164,210 @@ class TestHashProperties(unittest.TestCase):
         """Test a batch of inputs for obvious collisions."""
         hashes = {}
         
-        # Test 1000 different inputs
-        for i in range(1000):
-            msg = f"test message {i}".encode()
-            digest = self.hasher.hexdigest(msg)
-            
-            # Check for collision
-            self.assertNotIn(digest, hashes, 
-                           f"Collision found: {msg} and {hashes.get(digest)}")
+        # Test 1000 different inputs, hashed in one batch
+        messages = [b"test message %d" % i for i in range(1000)]
+        for msg, digest in zip(messages, self.hasher.hash_batch(messages)):
+            # Check for collision on the raw digest; hex and the failure
+            # message are only produced if one is found
+            if digest in hashes:
+                self.fail(f"Collision found: {msg} and {hashes[digest]} ({digest.hex()})")
             hashes[digest] = msg
 
 
+class TestKnownAnswers(unittest.TestCase):
+    """Test that optimized code paths reproduce the reference digests."""
+    
+    NORMAL_VECTORS = [
+        (b"", "547462ef422a053d746bff0b0ea08187b4c98c258986269d51ed07c95f519364"),
+        (b"abc", "b7b3af3fe0e52b9a4f4499ee77d04eb78af35d451e4e1243625ee37da2f8a21e"),
+        (b"The quick brown fox jumps over the lazy dog",
+         "105b27b6cc332fe4744be198dca4b5d3ef96398cbcf0e8cf574d8cf8bf0fbf32"),
+        (bytes(range(256)), "f734e40b010074829ca8f286c9668fbab96c75c92033907a10a52cafcee34f28"),
+    ]
+    
+    FAST_VECTORS = [
+        (b"", "0991de18216ce6b0633d3913e04117aded86f8ef2cd0a8f561e7a69fa97f66ff"),
+        (b"abc", "afd45245dd3f4f86ec3cb12612fee5376c2e4cf97e396b6ed8ca49adec75cd32"),
+        (b"The quick brown fox jumps over the lazy dog",
+         "07cf4770e808039a92cea5212a4cd426c8ed4f478892edaed8baede61019abfc"),
+        (bytes(range(256)), "75115760ee89eccceb3783998c11659a119e990bf0efbd4e56f1eaa545f295a4"),
+    ]
+    
+    # (normal mode, fast mode) digest of each golden_messages() entry
+    GOLDEN_DIGESTS = [
+        ("547462ef422a053d746bff0b0ea08187b4c98c258986269d51ed07c95f519364",
+         "0991de18216ce6b0633d3913e04117aded86f8ef2cd0a8f561e7a69fa97f66ff"),
+        ("8b7fb3334eac40d87cc7d4e17df1a79b88d303a1f052fd1a4a698c8f3e1c279d",
+         "2001b22123b81549850fc387b6c81c3a3514af59665b3398112da1b248ce3533"),
+        ("b7b3af3fe0e52b9a4f4499ee77d04eb78af35d451e4e1243625ee37da2f8a21e",
+         "afd45245dd3f4f86ec3cb12612fee5376c2e4cf97e396b6ed8ca49adec75cd32"),
+        ("07d0d9ffc7da1fc8b4f701851eb3be8e560f065e3d1972fd4f6b770901ee4272",
+         "533e779cad7edfafecc1f4f188552b63baa1b9cda89f357d8c62e09ad9d1a719"),
+        ("f734e40b010074829ca8f286c9668fbab96c75c92033907a10a52cafcee34f28",
+         "75115760ee89eccceb3783998c11659a119e990bf0efbd4e56f1eaa545f295a4"),
+        ("a8c85b27cb64d5cac4a977ae6c50c56b935f3c27e381e078491317c44b37b979",
+         "820a0f276fbdd4bbc44da9d0b0d6a3ff8a5cca8183429b48a98a6947ced35b58"),
+        ("7e663ab3a69f5c5d38af70418d73e13942536cc2925531eef1a2c0945687b8d4",
+         "388152829f0698356600a72866e9c018cc33cfc0d40d1d41661a2b6f373a3bd3"),
+        ("ae3e53b4e0c42e43429e77e110932b134adf28d438deaed8de0fa4f7051c6c03",
+         "aedb12e3a96874fcd297591dd0eec51039d66dad790607536022d16a7066372c"),
+        ("b8952f8665ac3d2a0c6faa9728f8f045c46335404e9f4714f9c47b233be70316",
+         "4b4698d2b1cb8c23a057de2236ae15afa294dc1661b6ae18ca384e333a6cfb47"),
+        ("7661848959d069ce9454a2ea22eed19dc36301da0952986ac456f4179e1b8ce3",
+         "df97d5055056f4102e74d92386d3cfff1bfcc0132ded9680040b2880c2450446"),
+        ("25af3e693f205cb1698291d20c207c5448eae9976036bda43e9bfd7e335a5b59",
+         "075a35c4878bc96ac6f0c1506ecd973b48f1d302c55f86171855b574972f00ce"),
+        ("6f26ee7e34c93376bcb72e1e277d815aa7f7193a0a1ae7c7f5901f3ff22e97e5",
+         "966ee01172b745de4f888708469f18ca8858755c901e457f0e3ec56f16211d9d"),
+        ("5f12b8ba11b6e425a5a8a98f9046ab477b9621f8e4162c18cfd0a0acad4ab3c2",
+         "edb56bf6faef88c2e326251b5e31ca61973d4487305102b9397592f0d8cac0bc"),
+        ("62ec36cb7ab57b92f616291fcc7939290a43cacfcb3635b7e5758f4b106d1301",
+         "447cd32fe22a2180ad0347406e1beacd04da5de36cd30959f4528d64c12bea69"),
+        ("9e397bedb767f038d18cc16ea42d42b15c2a82132cac1839bad461d950097af2",
+         "ea2bbbab0c9b1e06907b0fdfe8e695710008ea9f506caead0a100616ce9bb5e5"),
+        ("3fd6b7bf888c17ef482d8abb080bb99d1acb491335f29242b0ef32e4ccc9dc13",
+         "a2a2adecb4fd12b481014cce6cc067f2626bb2a56c0e86a23ba053ef39725bc3"),
+        ("9fea015df22776836b95c39b06f97abd37bb4b616ccd8423d552742ca0913363",
+         "50f964443ed6ebfbc91169318e50d8c50404e309f87e2ce22ba59ec817b29cd9"),
+        ("c5fa57f7ad697f0758356be139743257ae5c7c55dd02a7e829ac095df6f96a4f",
+         "b0b2d3dd69509cf8a5bd9f9e1e43aaec797e5230826fc95548c19c8cb3f67368"),
+        ("2b8c46e1a5c21c0173d8e34fa6d5cb3bd219fd5c92a93271fb104e8b06b1c678",
+         "f297aec4f5ef4e7e435e8940306ac5f9d45a0a0d08f9ea013aa27cb4e55db29e"),
+        ("a34a35ffddab41ad8a379069dddf197fbeb8df3bb247b265b846e944951700fb",
+         "1af84fd86ad3ad1bbbb83551ae0fa5a8c897b28f7858c9b0f6dd2e262b999474"),
+        ("ec4e4dd572fc13f7badba0134aee932b6ddc24f7b2edb22bb18d11451e5454df",
+         "9447400729f432a10a3994677644399808ef6552b35dc6cdab8e0680380f8cc1"),
+        ("5b423a54652c4d117a33c82bec0c573540263821aed6dab7841a87f8e5c4876c",
+         "720447e3eae11db2f80f3423f6a09b288c2d644fe03448a446af76137129c940"),
+        ("ae208138ac3b51d2b594a5cb3961d0da40658ea8816f29a7ac5bb78324de731a",
+         "a1e465da8a5883ed15c3cf57bc463a834ff4ae15b123e794c94c3a0a96a5c623"),
+        ("7d7f5667f46471e2dfa642ddf24319f19111124c6e728a68a443d501f10abb8f",
+         "3c40b9cc81a2f9e97f34a624341b615ebf1f49402584014e67b0c26ef067e73b"),
+        ("0f9b9ad107b1a2c3dde80c3d1aa2af281aba60119a7116bb4c43786394d225d7",
+         "c1df4acd1ebaaf5acfffe68f1a5946121a0e6330d3eccac58c34fe6f7d41b5f9"),
+        ("a022d3c0992dfa5fa94c26a2fcb45b7e3f62dc56ab5140c94ddfb6f8e56589f1",
+         "2382ad987d6dc5e86e2bacb866d88f6b6ab9413aaededa085d140efda501e5db"),
+        ("91567aad51d3fd572462523ad1d513b189641b44627fd5a44f9c722fb9f0df5d",
+         "42fbd697b2c35d0085ac5dd89450a40673f5333630dd18dd7255550b76bf3e47"),
+        ("b0177d88254281f45b35371b4713c8c725b28ffa6ffe6d8b39b351a9eacc928b",
+         "7df1db23358ba0543306f50de43e72946d7f8a601dbbd093200c6153fffef33c"),
+        ("33077eaa495eab2cd30b780c966770f0909cd55026bd062fe630c0948864eea1",
+         "6b88aee20f6f6b58376c59bdbe0426b1ff3ec75f1fa4121983797c70fb9523ce"),
+        ("8c32819c8e957f8ba18ec926ad285c016c1af5075482bbbff585c9fbe4efdc50",
+         "3583a588aade027c6b1b9308bec3a20547aa3b7f35811ed8a531b71364e82de3"),
+        ("f3f7d483c909094a556aeb95ef8ec0b01497d6f55c20bda7c8bee95f85b8ba26",
+         "77862a9950c53eafa7602e77d0da39481ae0e62d84e0f447aaf46dfe16c1dcbf"),
+        ("c7216908940e84d63e53f3f0075a19b48056aca3a0d6aa8628564958225ff395",
+         "2c2e68dd8df559f0302b98d594e792aaa65a11a51e8e605bde1317ea38b19bd5"),
+        ("58d5545cfb7696cf530b5b6d838733ffe93b543457fcfe076b928086923c0d56",
+         "7edd4236318a1d6f31e56b226c20787bbc9a53ca5d1dc769d3991af9ff728258"),
+        ("4dbade2ac314a790bcd81bd6d09166c3e6501c535963d191e1a6fd4e05c78581",
+         "fc776eb9c270b597a54e5606d8cbd7f1ec621cb5f6abd7ecf358756859e2a0c8"),
+        ("bb5073d12408ea624f0ab3711de68ec8283778fb0458c6f13b52fbcd3f1c316d",
+         "65ebe8611846188fd867527c7cae1437f825cb99bb2f59fb803f90a9ba4559ac"),
+        ("cf3be9bc3b7f1d85dc5adf94c657f8aca59195c8f404e532f438526b5bb9a601",
+         "5f87fc1c85e45f4619c68a3f0853185b0b3572c490867ae4f3d39f9b877d9763"),
+        ("120bae0f2c7be1c14015601ff2ba7d90fd04acacb917152cb088c9b489119396",
+         "ba4c9ce6a1de5921c1be3f6732397e436766e080aa024eae641a5ff83f836861"),
+        ("11430e0b7211316e9d3ac55b4c44894499979af6fb26cf722b91864fd44c0495",
+         "e7c8cb25d00c949eb59977a74c9da56eb869c2a0078423962095205d90ac3096"),
+        ("61710787a36f957bb28cd146008a20da43e6fb2d27526db03e21ba04155723be",
+         "0e6de5b4fd21ea453a0a5eac1eb9eb130c6da6040d5bfc79afbf5403a67eb522"),
+        ("f85afc47e3ad60248b9770c5f0cc4ef1879b18acf3a980efc3e323e56b4e8218",
+         "884025cf7b47c21f2e46b95cc83a56daa62951f55c513fe73fd11f54f59ef9a8"),
+        ("ead2ffad5301f6869f6ad5c43af9d8060d8c4b5f20220b61ee34071b4e8af916",
+         "0409497734d3b133f2cded8948fb45925155d4371c3114762b0bd8d3f5ec95ac"),
+        ("02012e783ab04c7b3c757df4dca5f1790d8a39d812eaeeee192b7adbcfc44a97",
+         "90cbc789dee97d24e5ec4dce8233ea1da23f4480bae99fff474d61cd2242ab76"),
+        ("fd95f4837b7553b54819fc81fa546e5ff9db8d7ff5b2a3409f2dca48dc2485ae",
+         "d2b699708f1567a6e4047229da9a0e3f77b2234cc9e1ea14832d838c78e8bf1e"),
+        ("9dd1ff4fe4dd7be0ed1a899b398fe174058fd0f72103954138932342e085ad00",
+         "e2cc2dd78f4a14fde6d42dc4ea9d3fc13f398847bcdf92b6cceb9f22d7bdee1f"),
+        ("1d1e4ec8b68eab72628a62af15b84602ced0982a96799cfc9b939e08c6876835",
+         "27c6b4b8116d5927a8654e2f166547b4f3926970ab0c935f46130017630fbb22"),
+        ("14155b2ce5f9561feed3ecdb9c801effdcc339bb5ad0655c85c713e046f3f864",
+         "86a4b87359f1828b20f4e0c5ba9c9079fc0b463e47e0e93958186c6647839c3e"),
+        ("73d9e561043ab5aae176fb99a3826586f50167e77d8215e5b479d7b8012830e0",
+         "9234cbc56b092e2daacf08735c4a637d606544d24003de621b57b179265f6667"),
+        ("acc086ce39f118ecffa626c9ecdaee591c8e0dcfe083dadb4bc4f522a302b5f3",
+         "a6559a14f3c1feb60e662e2a72b0f528c2465742389473eea5b946e7a10478db"),
+        ("2e4bdc04170880ddaeec965eb36fd9b4d62e6f4a36e5a96fa774585634c0b84d",
+         "2507e4872259f1d95d8973f1aa67ab92768646f1750f7cbb92f07f99caad4113"),
+        ("f285f63c5673209120d184dc87b437f7163b32f44c44306a230e5f272ca29392",
+         "696efe2787f70705ced13f58faf83ee29a142ee166a16f5664fa46e724828cb7"),
+        ("e0993011d8b06b8bcb63dd2057cc54e6fcb18ad65b45b3fc07afa3722eff6065",
+         "3fc8ac857f46b8531fea64ff38863c7108eaa9a49b436daa2b00fa3008a3d92f"),
+        ("6591e84a2f5803eb0a8090c779039f720a028b14b2513d7d24855ed7df3c4006",
+         "bcff03a307a78c7cea8cd9323ed3db68fbdacc1de74f1cf95add8224e067ef9b"),
+    ]
+    
+    def test_normal_mode_vectors(self):
+        """Test normal mode against known digests."""
+        hasher = ChronoHash()
+        for msg, expected in self.NORMAL_VECTORS:
+            self.assertEqual(hasher.hexdigest(msg), expected, f"Mismatch for {msg[:16]!r}")
+    
+    def test_fast_mode_vectors(self):
+        """Test fast mode against known digests."""
+        hasher = ChronoHash(fast_mode=True)
+        for msg, expected in self.FAST_VECTORS:
+            self.assertEqual(hasher.hexdigest(msg), expected, f"Mismatch for {msg[:16]!r}")
+    
+    def test_golden_vectors(self):
+        """Test hash() and hash_batch() on every backend against the golden set."""
+        messages = golden_messages()
+        # The pure-Python backend, and the default one when that differs
+        for backend in sorted({'python', ChronoHash().backend}):
+            for mode, fast_mode in enumerate((False, True)):
+                hasher = ChronoHash(fast_mode=fast_mode, backend=backend)
+                expected = [digests[mode] for digests in self.GOLDEN_DIGESTS]
+                with self.subTest(backend=backend, fast_mode=fast_mode):
+                    self.assertEqual([hasher.hexdigest(msg) for msg in messages], expected)
+                    self.assertEqual(hasher.hexdigest_batch(messages), expected)
+    
+    def test_unrolled_block_matches_reference(self):
+        """Test generated block functions against the reference methods."""
+        hasher = ChronoHash()
+        rng = random.Random(0)
+        for total_rounds in range(20, 33):
+            state = [rng.getrandbits(32) for _ in range(8)]
+            data = [rng.getrandbits(32) for _ in range(16)]
+            
+            expected = hasher._temporal_diffusion(state, data)
+            for round_num in range(total_rounds):
+                expected = hasher._compression_round(expected, data, round_num)
+            expected = tuple((s + iv) & 0xFFFFFFFF for s, iv in zip(expected, hasher.INITIAL_STATE))
+            
+            self.assertEqual(_make_block_fn(total_rounds)(state, data), expected,
+                             f"Mismatch for {total_rounds} rounds")
+    
+    def test_unrolled_fast_block_matches_reference(self):
+        """Test the generated fast-mode block against a round-by-round loop."""
+        rng = random.Random(1)
+        for _ in range(10):
+            state = [rng.getrandbits(32) for _ in range(8)]
+            data = [rng.getrandbits(32) for _ in range(16)]
+            
+            expected = state[:]
+            for round_num in range(8):
+                rot = ChronoHash.ROTATIONS[round_num]
+                for i in range(8):
+                    b = expected[(i + 1) & 7]
+                    temp = (expected[i] ^ ((b << rot) | (b >> (32 - rot)))) + expected[(i + 5) & 7]
+                    temp = (temp ^ data[round_num + i]) * ChronoHash.PRIMES[i]
+                    expected[i] = (expected[i] + temp) & 0xFFFFFFFF
+            expected = tuple((s + iv) & 0xFFFFFFFF for s, iv in zip(expected, ChronoHash.INITIAL_STATE))
+            
+            self.assertEqual(_make_block_fn(8, fast=True)(state, data), expected)
+
+
 class TestDynamicRounds(unittest.TestCase):
     """Test dynamic round calculation feature."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.hasher = ChronoHash()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one hasher shared by every test in the class."""
+        cls.hasher = ChronoHash()
     
     def test_dynamic_rounds_increase(self):
         """Test that more complex inputs get more rounds."""
@@ -180,22 +386,196 @@ class TestDynamicRounds(unittest.TestCase):
         """Test that base rounds are applied."""
         rounds = self.hasher._calculate_dynamic_rounds(b"test")
         self.assertGreaterEqual(rounds, 20)  # Updated from 16 to 20
+    
+    def test_rounds_match_unique_byte_count(self):
+        """Test that every unique-byte counting path agrees with a set."""
+        rng = random.Random(7)
+        python_hasher = ChronoHash(backend='python')
+        messages = [rng.randbytes(length) for length in (1, 8, 31, 32, 100, 127, 128, 300, 2000)]
+        # Multi-chunk inputs: full coverage early, and new byte values late
+        messages += [rng.randbytes(70000), b"a" * 70000 + bytes(range(200))]
+        for msg in messages:
+            expected = 20 + int(len(set(msg)) / 256.0 * 12)
+            self.assertEqual(self.hasher._calculate_dynamic_rounds(msg), expected)
+            self.assertEqual(python_hasher._calculate_dynamic_rounds(msg), expected)
+            # Without NumPy every length takes the set() path
+            with mock.patch.object(chronohash_module, 'np', None):
+                self.assertEqual(python_hasher._calculate_dynamic_rounds(msg), expected)
+
+
+class TestHashBatch(unittest.TestCase):
+    """Test batch hashing of independent messages."""
+    
+    MESSAGES = [
+        b"",
+        b"a",
+        b"abc",
+        b"message digest",
+        bytes(range(256)),
+        b"x" * 1000,
+        b"y" * 55,
+        b"y" * 56,
+        b"z" * 64,
+        b"z" * 120,
+    ] + [b"lane %d" % i for i in range(40)]  # enough to fill a vectorized group
+    
+    def test_matches_single_hash(self):
+        """Test that batch digests equal per-message digests in both modes."""
+        for fast_mode in (False, True):
+            hasher = ChronoHash(fast_mode=fast_mode)
+            expected = [hasher.hash(msg) for msg in self.MESSAGES]
+            self.assertEqual(hasher.hash_batch(self.MESSAGES), expected,
+                             f"Batch mismatch with fast_mode={fast_mode}")
+    
+    def test_threaded_hashing(self):
+        """Test that concurrent hash() calls from threads match serial ones."""
+        hasher = ChronoHash()
+        messages = self.MESSAGES * 4
+        expected = [hasher.hash(msg) for msg in messages]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            self.assertEqual(list(pool.map(hasher.hash, messages)), expected)
+    
+    def test_python_backend_lanes(self):
+        """Test the NumPy lane path of the pure-Python backend in both modes."""
+        for fast_mode in (False, True):
+            hasher = ChronoHash(fast_mode=fast_mode, backend='python')
+            expected = [hasher.hash(msg) for msg in self.MESSAGES]
+            self.assertEqual(hasher.hash_batch(self.MESSAGES), expected)
+    
+    def test_large_batch(self):
+        """Test a batch big enough for the multithreaded kernel in both modes."""
+        messages = self.MESSAGES + [bytes([i]) * 1000 for i in range(100)]
+        for fast_mode in (False, True):
+            for parallel in (False, True):
+                hasher = ChronoHash(fast_mode=fast_mode, parallel=parallel)
+                expected = [hasher.hash(msg) for msg in messages]
+                self.assertEqual(hasher.hash_batch(messages), expected)
+    
+    def test_parallel_is_opt_in(self):
+        """Test that large batches stay on one thread unless parallel=True."""
+        messages = [bytes([i]) * 2000 for i in range(64)]
+        with mock.patch.object(chronohash_module, '_nb_hash_many_parallel') as kernel:
+            ChronoHash().hash_batch(messages)
+        kernel.assert_not_called()
+    
+    def test_concurrent_large_batches(self):
+        """Test multithreaded-kernel batches launched from several threads."""
+        hasher = ChronoHash(parallel=True)
+        messages = [bytes([i]) * 2000 for i in range(64)]
+        expected = [hasher.hash(msg) for msg in messages]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            for digests in pool.map(hasher.hash_batch, [messages] * 16):
+                self.assertEqual(digests, expected)
+    
+    def test_hexdigest_batch(self):
+        """Test that batch hex digests equal per-message hex digests."""
+        hasher = ChronoHash()
+        expected = [hasher.hexdigest(msg) for msg in self.MESSAGES]
+        self.assertEqual(hasher.hexdigest_batch(self.MESSAGES), expected)
+    
+    def test_empty_batch(self):
+        """Test that an empty batch returns no digests."""
+        self.assertEqual(ChronoHash().hash_batch([]), [])
+
+
+class TestHashTree(unittest.TestCase):
+    """Test the tree-hash construction."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up one hasher shared by every test in the class."""
+        cls.hasher = ChronoHash()
+    
+    def test_root_of_leaf_digests(self):
+        """Test that the root hashes the tagged header and leaf digests."""
+        msg = bytes(range(256)) * 40  # 10 leaves of 1 KB
+        leaves = b"".join(self.hasher.hash(b"\x00" + msg[i:i + 1024]) for i in range(0, len(msg), 1024))
+        header = b"\x01" + (1024).to_bytes(8, "big") + len(msg).to_bytes(8, "big")
+        self.assertEqual(self.hasher.hash_tree(msg, leaf_size=1024), self.hasher.hash(header + leaves))
+    
+    def test_differs_from_hash(self):
+        """Test that tree hashing is a distinct function from hash()."""
+        for msg in (b"", b"abc", b"x" * 10000):
+            self.assertNotEqual(self.hasher.hash_tree(msg), self.hasher.hash(msg))
+            self.assertNotEqual(self.hasher.hash_tree(msg), self.hasher.hash(self.hasher.hash(msg)))
+    
+    def test_leaf_size(self):
+        """Test that the digest depends on leaf size and rejects bad sizes."""
+        for msg in (b"x" * 10000, b"abc"):  # Several leaves, and a single leaf
+            self.assertNotEqual(self.hasher.hash_tree(msg, leaf_size=1024),
+                                self.hasher.hash_tree(msg, leaf_size=4096))
+        with self.assertRaises(ValueError):
+            self.hasher.hash_tree(msg, leaf_size=0)
+
+
+class TestBackends(unittest.TestCase):
+    """Test backend selection."""
+    
+    def _available_backends(self):
+        backends = []
+        for backend in ChronoHash.BACKENDS:
+            try:
+                ChronoHash(backend=backend)
+            except RuntimeError:
+                continue
+            backends.append(backend)
+        return backends
+    
+    def test_backends_agree(self):
+        """Test that every available backend produces the pure-Python digests."""
+        messages = TestHashBatch.MESSAGES[:12]
+        for fast_mode in (False, True):
+            reference = ChronoHash(fast_mode=fast_mode, backend='python')
+            expected = [reference.hash(msg) for msg in messages]
+            for backend in self._available_backends():
+                hasher = ChronoHash(fast_mode=fast_mode, backend=backend)
+                with self.subTest(backend=backend, fast_mode=fast_mode):
+                    self.assertEqual([hasher.hash(msg) for msg in messages], expected)
+                    self.assertEqual(hasher.hash_batch(messages), expected)
+    
+    def test_default_backend(self):
+        """Test that the default backend is one of the known backends."""
+        self.assertIn(ChronoHash().backend, ChronoHash.BACKENDS)
+    
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            ChronoHash(backend='fortran')
+
+
+@unittest.skipIf(_cuda_hash_batch is None, "CUDA device or simulator not available")
+class TestHashBatchCuda(unittest.TestCase):
+    """Test CUDA batch hashing (runs on the simulator with NUMBA_ENABLE_CUDASIM=1)."""
+    
+    MESSAGES = TestHashBatch.MESSAGES[:12]
+    
+    def test_matches_single_hash(self):
+        """Test that CUDA batch digests equal per-message digests in both modes."""
+        for fast_mode in (False, True):
+            hasher = ChronoHash(fast_mode=fast_mode)
+            expected = [hasher.hash(msg) for msg in self.MESSAGES]
+            self.assertEqual(hasher.hash_batch_cuda(self.MESSAGES), expected)
+    
+    def test_empty_batch(self):
+        """Test that an empty batch returns no digests."""
+        self.assertEqual(ChronoHash().hash_batch_cuda([]), [])
 
 
 class TestPerformance(unittest.TestCase):
     """Test performance characteristics."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.hasher = ChronoHash()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one hasher shared by every test in the class."""
+        cls.hasher = ChronoHash()
     
     def test_reasonable_speed(self):
         """Test that hashing completes in reasonable time."""
         msg = b"x" * 10000  # 10KB message
         
-        start = time.time()
+        start = time.perf_counter()
         digest = self.hasher.hexdigest(msg)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should complete in under 1 second for 10KB
         self.assertLess(elapsed, 1.0, 
@@ -215,17 +595,27 @@ class TestPerformance(unittest.TestCase):
 class TestComparisonWithSHA256(unittest.TestCase):
     """Compare ChronoHash characteristics with SHA-256."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.chronohash = ChronoHash()
+    MESSAGES = [
+        b"",
+        b"a",
+        b"abc",
+        b"test",
+        b"test message",
+        b"test messagf",
+        b"The quick brown fox jumps over the lazy dog",
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
+        """Hash every fixture message once with both functions."""
+        cls.chronohash = ChronoHash()
+        cls.chrono_digests = {msg: cls.chronohash.hash(msg) for msg in cls.MESSAGES}
+        cls.sha_digests = {msg: hashlib.sha256(msg).digest() for msg in cls.MESSAGES}
     
     def test_output_size_matches_sha256(self):
         """Test that output size matches SHA-256."""
         msg = b"test"
-        chrono_digest = self.chronohash.hash(msg)
-        sha_digest = hashlib.sha256(msg).digest()
-        
-        self.assertEqual(len(chrono_digest), len(sha_digest))
+        self.assertEqual(len(self.chrono_digests[msg]), len(self.sha_digests[msg]))
     
     def test_different_from_sha256(self):
         """Test that ChronoHash produces different hashes than SHA-256."""
@@ -237,10 +627,7 @@ class TestComparisonWithSHA256(unittest.TestCase):
         ]
         
         for msg in test_messages:
-            chrono_digest = self.chronohash.hexdigest(msg)
-            sha_digest = hashlib.sha256(msg).hexdigest()
-            
-            self.assertNotEqual(chrono_digest, sha_digest,
+            self.assertNotEqual(self.chrono_digests[msg], self.sha_digests[msg],
                               f"ChronoHash should differ from SHA-256 for: {msg}")
     
     def test_comparable_avalanche(self):
@@ -249,16 +636,10 @@ class TestComparisonWithSHA256(unittest.TestCase):
         msg2 = b"test messagf"
         
         # ChronoHash avalanche
-        chrono_digest1 = self.chronohash.hash(msg1)
-        chrono_digest2 = self.chronohash.hash(msg2)
-        chrono_diff = sum(bin(b1 ^ b2).count('1') 
-                         for b1, b2 in zip(chrono_digest1, chrono_digest2))
+        chrono_diff = hamming_distance(self.chrono_digests[msg1], self.chrono_digests[msg2])
         
         # SHA-256 avalanche
-        sha_digest1 = hashlib.sha256(msg1).digest()
-        sha_digest2 = hashlib.sha256(msg2).digest()
-        sha_diff = sum(bin(b1 ^ b2).count('1') 
-                      for b1, b2 in zip(sha_digest1, sha_digest2))
+        sha_diff = hamming_distance(self.sha_digests[msg1], self.sha_digests[msg2])
         
         # Both should have good avalanche (around 128 bits for 256-bit hash)
         self.assertGreater(chrono_diff, 100, "ChronoHash avalanche too weak")
@@ -268,9 +649,10 @@ class TestComparisonWithSHA256(unittest.TestCase):
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and boundary conditions."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.hasher = ChronoHash()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one hasher shared by every test in the class."""
+        cls.hasher = ChronoHash()
     
     def test_null_bytes(self):
         """Test handling of null bytes."""